@@ -0,0 +1,260 @@
+import argparse
+import copy
+import random
+import sys
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from pymongo import MongoClient
+
+# Vocabulary used to build synthetic KDRT news articles.
+# The cities include the ones recognised by extract_location() in
+# kdrt_visualizer.py plus a few that are not, so the "Unknown" bucket
+# is populated the same way it is with real scraped data.
+CITIES = [
+    'Jakarta', 'Surabaya', 'Bandung', 'Medan', 'Makassar',
+    'Semarang', 'Palembang', 'Tangerang', 'Depok', 'Bogor',
+    'Bekasi', 'Malang', 'Padang', 'Pekanbaru', 'Denpasar',
+    'Yogyakarta', 'Pontianak', 'Banjarmasin', 'Manado', 'Kupang'
+]
+
+PELAKU = ['suami', 'istri', 'ayah tiri', 'mertua', 'mantan suami', 'kakak ipar', 'ibu kandung']
+KORBAN = ['istri', 'suami', 'anak', 'anak tiri', 'menantu', 'ibu rumah tangga', 'balita']
+TINDAKAN = [
+    'menganiaya', 'memukul', 'menendang', 'menyiram air panas ke',
+    'mencekik', 'menusuk', 'menelantarkan', 'mengancam'
+]
+INSTANSI = [
+    'Polres', 'Polresta', 'Polsek', 'Polda', 'Unit PPA Polres',
+    'Satreskrim Polres', 'Dinas Pemberdayaan Perempuan dan Perlindungan Anak'
+]
+PEJABAT = ['Kapolres', 'Kasat Reskrim', 'Kanit PPA', 'Kapolsek', 'Kepala Dinas']
+NAMA = [
+    'Budi', 'Andi', 'Rudi', 'Agus', 'Dedi', 'Joko', 'Hendra', 'Sri',
+    'Dewi', 'Siti', 'Rina', 'Wati', 'Yanti', 'Ayu', 'Fitri', 'Nur'
+]
+
+JUDUL_TEMPLATES = [
+    '{pelaku_cap} di {kota} Tega {tindakan_cap} {korban_cap}, Pelaku Ditangkap',
+    'Polisi Tangkap {pelaku_cap} Pelaku KDRT terhadap {korban_cap} di {kota}',
+    'Kasus KDRT di {kota}: {korban_cap} Luka-luka Usai Dianiaya {pelaku_cap}',
+    '{korban_cap} Korban KDRT di {kota} Lapor Polisi, Ini Kronologinya',
+    '{pelaku_cap} yang {tindakan} {korban_cap} di {kota} Terancam 10 Tahun Penjara',
+    'Viral Video KDRT di {kota}, {instansi} Turun Tangan',
+]
+
+KALIMAT_TEMPLATES = [
+    'Seorang {pelaku} berinisial {inisial} di {kota} ditangkap polisi setelah diduga {tindakan} {korban} di rumah mereka.',
+    'Peristiwa kekerasan dalam rumah tangga (KDRT) itu terjadi pada {hari} malam sekitar pukul {jam}.00 WIB.',
+    '{pejabat} {instansi} {kota}, {nama}, membenarkan adanya laporan tersebut.',
+    '"Pelaku sudah kami amankan dan saat ini masih menjalani pemeriksaan intensif," kata {nama} kepada wartawan.',
+    'Korban mengalami luka memar di bagian wajah dan tangan sehingga harus dilarikan ke rumah sakit terdekat.',
+    'Menurut keterangan saksi, pertengkaran dipicu oleh masalah ekonomi dan rasa cemburu.',
+    'Tetangga yang mendengar teriakan minta tolong kemudian melaporkan kejadian itu ke {instansi} {kota}.',
+    'Atas perbuatannya, pelaku dijerat Pasal 44 Undang-Undang Nomor 23 Tahun 2004 tentang Penghapusan KDRT.',
+    'Pelaku terancam hukuman penjara maksimal {tahun} tahun atau denda paling banyak Rp {denda} juta.',
+    'Pihak kepolisian mengimbau masyarakat untuk tidak ragu melaporkan kasus KDRT yang terjadi di lingkungannya.',
+    'Korban kini mendapatkan pendampingan psikologis dari {instansi} {kota}.',
+    'Berdasarkan data yang dihimpun, kasus KDRT di wilayah {kota} meningkat dibandingkan tahun sebelumnya.',
+    'Polisi juga menyita barang bukti berupa {barang} yang digunakan pelaku saat kejadian.',
+    'Hingga berita ini diturunkan, pelaku masih ditahan di rumah tahanan {instansi} {kota}.',
+]
+
+HARI = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
+BARANG = ['sebilah pisau', 'sebatang kayu', 'ikat pinggang', 'sapu', 'panci', 'telepon genggam']
+KANAL = ['berita', 'jatim', 'jabar', 'sumut', 'sulsel', 'jateng', 'bali']
+
+VOCABULARY = {
+    'pelaku': PELAKU,
+    'korban': KORBAN,
+    'tindakan': TINDAKAN,
+    'instansi': INSTANSI,
+    'pejabat': PEJABAT,
+    'nama': NAMA,
+    'hari': HARI,
+    'barang': BARANG,
+    'tahun': [5, 10, 15],
+    'denda': [15, 30, 45],
+}
+
+DEFAULT_START_DATE = datetime(2019, 1, 1)
+DEFAULT_END_DATE = datetime(2025, 5, 31)
+
+
+def _slugify(title):
+    slug = ''.join(c.lower() if c.isalnum() else '-' for c in title)
+    return '-'.join(part for part in slug.split('-') if part)
+
+
+class _Placeholders(dict):
+    """Draws a random value only for the placeholders a template actually uses."""
+
+    def __init__(self, rng, kota):
+        super().__init__(kota=kota)
+        self.rng = rng
+
+    def __missing__(self, key):
+        rng = self.rng
+        if key == 'inisial':
+            return rng.choice('ABCDEFGHIJKLMNOPRSTUWY') + rng.choice('ABCDEFGHIJKLMNOPRSTUWY')
+        if key == 'jam':
+            return rng.randint(0, 23)
+        if key.endswith('_cap'):
+            return rng.choice(VOCABULARY[key[:-4]]).title()
+        return rng.choice(VOCABULARY[key])
+
+
+def _fill(template, rng, kota):
+    return template.format_map(_Placeholders(rng, kota))
+
+
+def generate_documents(count, seed=42, start_date=DEFAULT_START_DATE,
+                       end_date=DEFAULT_END_DATE, null_date_ratio=0.0):
+    """Yield `count` synthetic articles with the same schema the scraper stores
+    in MongoDB (`judul`, `tanggal`, `link`, `isi`).
+
+    Like app.py, every document gets a date by default. Set `null_date_ratio`
+    to store `tanggal=None` for that share of documents, e.g. to exercise the
+    null-date filter in load_data()."""
+    rng = random.Random(seed)
+    span_seconds = int((end_date - start_date).total_seconds())
+
+    for i in range(count):
+        kota = rng.choice(CITIES)
+        judul = _fill(rng.choice(JUDUL_TEMPLATES), rng, kota)
+
+        if rng.random() < null_date_ratio:
+            tanggal = None
+        else:
+            tanggal = start_date + timedelta(seconds=rng.randrange(span_seconds))
+
+        article_id = 7000000 + i
+        link = f"https://www.detik.com/{rng.choice(KANAL)}/d-{article_id}/{_slugify(judul)}"
+
+        kalimat = rng.sample(KALIMAT_TEMPLATES, rng.randint(5, 10))
+        isi = ' '.join(_fill(k, rng, kota) for k in kalimat)
+
+        yield {
+            'judul': judul,
+            'tanggal': tanggal,
+            'link': link,
+            'isi': isi
+        }
+
+
+# In-memory stand-in for the parts of the pymongo API used by the dashboard
+class InMemoryCollection:
+    def __init__(self, name, documents=None):
+        self.name = name
+        self._documents = []
+        if documents:
+            self.insert_many(documents)
+
+    def insert_many(self, documents):
+        for doc in documents:
+            doc = dict(doc)
+            doc.setdefault('_id', ObjectId())
+            self._documents.append(doc)
+
+    def find(self, query=None):
+        if query:
+            raise ValueError("InMemoryCollection only supports full scans (an empty query)")
+        # pymongo hands out fresh dicts on every query; callers are free to mutate them
+        return (copy.copy(doc) for doc in self._documents)
+
+    def find_one(self, query=None):
+        return next(self.find(query), None)
+
+    def count_documents(self, query=None):
+        if query:
+            raise ValueError("InMemoryCollection only supports full scans (an empty query)")
+        return len(self._documents)
+
+
+class InMemoryDatabase:
+    def __init__(self, name):
+        self.name = name
+        self._collections = {}
+
+    def __getitem__(self, name):
+        if name not in self._collections:
+            self._collections[name] = InMemoryCollection(name)
+        return self._collections[name]
+
+    def list_collection_names(self):
+        return list(self._collections)
+
+    def command(self, command, value=None):
+        if command != 'collstats':
+            raise ValueError(f"InMemoryDatabase only supports the 'collstats' command, got {command!r}")
+        return {'ns': f"{self.name}.{value}", 'count': self[value].count_documents({})}
+
+
+class InMemoryClient:
+    def __init__(self):
+        self._databases = {}
+
+    def __getitem__(self, name):
+        if name not in self._databases:
+            self._databases[name] = InMemoryDatabase(name)
+        return self._databases[name]
+
+    def list_database_names(self):
+        return list(self._databases)
+
+
+def create_in_memory_client(count, db_name='CrawlingScrapping', coll_name='kdrt', seed=42):
+    """Build an InMemoryClient whose `db_name.coll_name` holds `count` synthetic articles."""
+    client = InMemoryClient()
+    client[db_name][coll_name].insert_many(generate_documents(count, seed=seed))
+    return client
+
+
+def load_into_mongodb(count, mongo_uri='mongodb://localhost:27017', db_name='CrawlingScrapping',
+                      coll_name='kdrt', seed=42, batch_size=10000, drop=False):
+    """Insert `count` synthetic articles into a (local) mongod in batches."""
+    client = MongoClient(mongo_uri)
+    collection = client[db_name][coll_name]
+
+    if drop:
+        collection.drop()
+
+    batch = []
+    inserted = 0
+    for doc in generate_documents(count, seed=seed):
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            collection.insert_many(batch, ordered=False)
+            inserted += len(batch)
+            batch = []
+            print(f"Inserted {inserted}/{count} documents")
+    if batch:
+        collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+        print(f"Inserted {inserted}/{count} documents")
+
+    client.close()
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load synthetic KDRT articles into MongoDB")
+    parser.add_argument('count', type=int, help="Number of documents to generate (e.g. 10000, 100000, 1000000)")
+    parser.add_argument('--uri', default='mongodb://localhost:27017', help="MongoDB URI")
+    parser.add_argument('--db', default='CrawlingScrapping', help="Database name")
+    parser.add_argument('--collection', default='kdrt', help="Collection name")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    parser.add_argument('--batch-size', type=int, default=10000, help="Documents per insert_many call")
+    parser.add_argument('--drop', action='store_true', help="Drop the collection before inserting")
+    args = parser.parse_args()
+
+    try:
+        load_into_mongodb(args.count, args.uri, args.db, args.collection,
+                          seed=args.seed, batch_size=args.batch_size, drop=args.drop)
+    except Exception as e:
+        print(f"Failed to load synthetic data: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
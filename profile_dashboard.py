@@ -0,0 +1,143 @@
+import argparse
+import csv
+import os
+import sys
+import time
+import tracemalloc
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+DASHBOARD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kdrt_visualizer.py')
+
+
+def _run_dashboard(doc_count, timeout, trace_memory):
+    """Run kdrt_visualizer.py once and return (section timings, total seconds, peak MB)."""
+    previous_docs = os.environ.get('KDRT_SYNTHETIC_DOCS')
+    os.environ['KDRT_SYNTHETIC_DOCS'] = str(doc_count)
+    # load_data() and the connection are cached process-wide; start every run cold
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+    app = AppTest.from_file(DASHBOARD_PATH, default_timeout=timeout)
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        app.run()
+        total_seconds = time.perf_counter() - start
+        final_peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2 if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        if previous_docs is None:
+            del os.environ['KDRT_SYNTHETIC_DOCS']
+        else:
+            os.environ['KDRT_SYNTHETIC_DOCS'] = previous_docs
+
+    if app.exception:
+        raise RuntimeError(f"Dashboard raised an exception: {app.exception[0].message}")
+
+    sections = dict(app.session_state['section_timings'])
+    peak_mb = None
+    if trace_memory:
+        # start_section() resets the tracemalloc peak for every section, so the
+        # peak of the whole run is the largest of the absolute section peaks
+        peak_mb = max([final_peak_mb] + [t['abs_peak_mb'] for t in sections.values()])
+    return sections, total_seconds, peak_mb
+
+
+def profile_dashboard(doc_count, timeout=3600, memory=False):
+    """Run kdrt_visualizer.py headlessly against `doc_count` synthetic articles.
+
+    Timings always come from a run without tracemalloc, which would otherwise
+    slow pandas/TextBlob work down several times. With `memory=True` a second,
+    traced run supplies, per section, the peak memory allocated on top of what
+    was alive when the section started, plus the absolute traced peak."""
+    sections, total_seconds, _ = _run_dashboard(doc_count, timeout, trace_memory=False)
+    sections = {name: {'seconds': t['seconds'], 'peak_mb': None, 'abs_peak_mb': None}
+                for name, t in sections.items()}
+
+    # Script start-up, imports and AppTest overhead that no section covers
+    sections['Unattributed'] = {
+        'seconds': max(total_seconds - sum(t['seconds'] for t in sections.values()), 0.0),
+        'peak_mb': None,
+        'abs_peak_mb': None
+    }
+
+    peak_mb = None
+    if memory:
+        traced_sections, _, peak_mb = _run_dashboard(doc_count, timeout, trace_memory=True)
+        for name, t in traced_sections.items():
+            sections[name]['peak_mb'] = t['peak_mb']
+            sections[name]['abs_peak_mb'] = t['abs_peak_mb']
+
+    return {
+        'docs': doc_count,
+        'sections': sections,
+        'total_seconds': total_seconds,
+        'peak_mb': peak_mb
+    }
+
+
+def _format_mb(value):
+    return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+
+def _format_csv_mb(value):
+    return f"{value:.3f}" if value is not None else ''
+
+
+def print_report(result):
+    print(f"\n=== {result['docs']} documents ===")
+    if result['peak_mb'] is None:
+        print("Seconds measured without tracemalloc; peak memory not measured (use --memory)")
+    else:
+        print("Seconds measured without tracemalloc; memory taken from a separate run under tracemalloc")
+        print("Section MB: peak allocated by the section itself; Abs MB: total traced memory at that peak")
+    print(f"{'Section':<20} {'Seconds':>10} {'Section MB':>10} {'Abs MB':>10}")
+    for name, t in result['sections'].items():
+        print(f"{name:<20} {t['seconds']:>10.3f} {_format_mb(t['peak_mb'])} {_format_mb(t['abs_peak_mb'])}")
+    print(f"{'Total run':<20} {result['total_seconds']:>10.3f} {_format_mb(None)} {_format_mb(result['peak_mb'])}")
+
+
+def write_csv(results, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['docs', 'section', 'seconds', 'section_peak_mb_traced', 'abs_peak_mb_traced'])
+        for result in results:
+            for name, t in result['sections'].items():
+                writer.writerow([result['docs'], name, f"{t['seconds']:.6f}",
+                                 _format_csv_mb(t['peak_mb']), _format_csv_mb(t['abs_peak_mb'])])
+            writer.writerow([result['docs'], 'Total run', f"{result['total_seconds']:.6f}",
+                             '', _format_csv_mb(result['peak_mb'])])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the KDRT dashboard on synthetic data")
+    parser.add_argument('sizes', type=int, nargs='*', default=[10000, 100000, 1000000],
+                        help="Corpus sizes to profile (default: 10000 100000 1000000)")
+    parser.add_argument('--timeout', type=float, default=3600, help="Seconds allowed for a single dashboard run")
+    parser.add_argument('--memory', action='store_true',
+                        help="Also measure peak memory per section in a second run under tracemalloc")
+    parser.add_argument('--csv', help="Write the timings to this CSV file")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        try:
+            result = profile_dashboard(size, timeout=args.timeout, memory=args.memory)
+        except Exception as e:
+            print(f"Profiling failed for {size} documents: {e}", file=sys.stderr)
+            continue
+        print_report(result)
+        results.append(result)
+
+    if args.csv and results:
+        write_csv(results, args.csv)
+        print(f"\nTimings written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()